@@ -1,5 +1,7 @@
 import itertools
 import logging
+import buddy
+import numpy as np
 import spot
 from tqdm import tqdm 
 from functools import reduce
@@ -369,6 +371,10 @@ class SpotAutomaton(Automaton):
         print(f"[INFO] Translating {self._formula} with options={options}.")
         self.spot_aut = spot.translate(formula, *options)
 
+        # Cache atoms (formula atoms and user-specified atoms), since atoms() is used by every delta call.
+        self._atoms_list = sorted({str(ap) for ap in self.spot_aut.ap()} | self._user_atoms)
+        self._atoms_set = frozenset(self._atoms_list)
+
         # Set the acceptance condition (in ggsolver terms)
         name = self.spot_aut.acc().name()
         if name == "Büchi" and spot.mp_class(formula).upper() in ["B", "S"]:
@@ -384,6 +390,49 @@ class SpotAutomaton(Automaton):
         else:  # name contains "parity":
             self._acc_cond = (Automaton.ACC_PARITY, 0)
 
+        # Compile the transition table once: a BDD over atoms and, for every state, the list of
+        #   (edge label as BDD node, next state) pairs. Unsatisfiable edges are dropped.
+        self._bdd = BDD()
+        self._bdd.declare(*self._atoms_list)
+        self._trans_cache = self._compile_transitions()
+        self._cube_cache = dict()
+
+    def _compile_transitions(self):
+        """
+        Translates the edge labels of spot automaton to BDD nodes (see :meth:`SpotAutomaton.delta`).
+
+        Edge labels (spot/buddy BDDs) are translated structurally into `self._bdd`, without formatting them
+        as formula strings and re-parsing them. Labels shared by several edges are translated only once.
+        """
+        bdd_dict = self.spot_aut.get_dict()
+        var_names = {bdd_dict.varnum(ap): str(ap) for ap in self.spot_aut.ap()}
+        memo = dict()
+        trans_cache = dict()
+        for state in self.states():
+            trans_cache[state] = []
+            for t in self.spot_aut.out(state):
+                v = self._spot_bdd_to_dd(t.cond, var_names, memo)
+                if v == self._bdd.false:
+                    continue
+                trans_cache[state].append((v, int(t.dst)))
+        return trans_cache
+
+    def _spot_bdd_to_dd(self, cond, var_names, memo):
+        """
+        Recursively translates a buddy BDD `cond` into an equivalent node of `self._bdd` using
+        if-then-else on its top variable. `var_names` maps buddy variable numbers to atoms.
+        """
+        if cond == buddy.bddtrue:
+            return self._bdd.true
+        if cond == buddy.bddfalse:
+            return self._bdd.false
+        if cond.id() not in memo:
+            var = self._bdd.var(var_names[buddy.bdd_var(cond)])
+            high = self._spot_bdd_to_dd(buddy.bdd_high(cond), var_names, memo)
+            low = self._spot_bdd_to_dd(buddy.bdd_low(cond), var_names, memo)
+            memo[cond.id()] = self._bdd.ite(var, high, low)
+        return memo[cond.id()]
+
     def _determine_options(self):
         """
         Determines the options based on where the given LTL formula lies in Manna-Pnueli hierarchy.
@@ -404,7 +453,7 @@ class SpotAutomaton(Automaton):
 
     def atoms(self):
         """ Atomic propositions appearing in LTL formula. """
-        return list({str(ap) for ap in self.spot_aut.ap()} | self._user_atoms)
+        return list(self._atoms_list)
 
     def delta(self, state, inp):
         """
@@ -415,29 +464,17 @@ class SpotAutomaton(Automaton):
         :param inp: (list) List of atoms that are true (an element of sigma).
         """
         # Preprocess inputs
-        inp_dict = {p: True for p in inp} | {p: False for p in self.atoms() if p not in inp}
-
-        # Initialize a BDD over set of atoms.
-        bdd = BDD()
-        bdd.declare(*self.atoms())
-
-        # Get spot BDD dict to extract formula
-        bdd_dict = self.spot_aut.get_dict()
+        inp_dict = dict.fromkeys(self._atoms_list, False)
+        for p in inp:
+            if p in self._atoms_set:
+                inp_dict[p] = True
 
-        # Get next states
+        # Get next states using the transition table compiled at construction.
+        bdd = self._bdd
         next_states = []
-        for t in self.spot_aut.out(state):
-            label = spot.bdd_format_formula(bdd_dict, t.cond)
-            label = spot.formula(label)
-            if label.is_ff():
-                continue
-            elif label.is_tt():
-                next_states.append(int(t.dst))
-            else:
-                label = spot.formula(label).to_str('spin')
-                v = bdd.add_expr(label)
-                if bdd.let(inp_dict, v) == bdd.true:
-                    next_states.append(int(t.dst))
+        for v, dst in self._trans_cache[state]:
+            if v == bdd.true or bdd.let(inp_dict, v) == bdd.true:
+                next_states.append(dst)
 
         # Return based on whether automaton is deterministic or non-deterministic.
         #   If automaton is deterministic but len(next_states) = 0, then automaton is incomplete, return None.
@@ -447,6 +484,84 @@ class SpotAutomaton(Automaton):
         if not self.is_deterministic():
             return next_states
 
+    def delta_batch(self, state, inputs):
+        """
+        Vectorized transition function of a deterministic automaton. Evaluates `delta(state, inp)` for
+        a batch of inputs at once.
+
+        :param state: (object) A valid state.
+        :param inputs: (numpy.ndarray) A boolean array of shape (L, len(atoms())). Row `l` is an input,
+            where column `k` is True iff `atoms()[k]` is true.
+        :return: (numpy.ndarray) An integer array of shape (L,) with the next state for every input.
+            If the automaton has no transition for an input (incomplete automaton), the next state is -1.
+        :raises ValueError: If `inputs` is not a 2D array with len(atoms()) columns.
+        """
+        if not self.is_deterministic():
+            raise NotImplementedError(f"{self.__class__.__name__}.delta_batch() is defined only for "
+                                      f"deterministic automata.")
+
+        inputs = np.asarray(inputs, dtype=bool)
+        if inputs.ndim != 2 or inputs.shape[1] != len(self._atoms_list):
+            raise ValueError(f"{self.__class__.__name__}.delta_batch() expects inputs of shape "
+                             f"(L, {len(self._atoms_list)}), got {inputs.shape}.")
+
+        pos, neg, dst = self._cube_masks(state)
+        next_states = np.full(inputs.shape[0], -1, dtype=np.int64)
+        if dst.shape[0] == 0:
+            return next_states
+
+        # An input satisfies a cube iff it sets all positive atoms and none of the negative atoms of the cube.
+        #   hit has shape (L, num. of cubes).
+        inputs = inputs[:, None, :]
+        hit = (inputs | ~pos).all(axis=-1) & ~(inputs & neg).any(axis=-1)
+        matched = hit.any(axis=1)
+        next_states[matched] = dst[hit.argmax(axis=1)[matched]]
+        return next_states
+
+    def _cube_masks(self, state):
+        """
+        Returns the edge labels of `state` as path cubes over atoms: arrays `pos, neg` of shape
+        (num. of cubes, len(atoms())) marking the atoms that must be true/false in the cube and an
+        array `dst` with the next state of every cube. The masks are computed once per state.
+        """
+        if state not in self._cube_cache:
+            index = {p: k for k, p in enumerate(self._atoms_list)}
+            cubes = []
+            for v, n_state in self._trans_cache[state]:
+                for assignment in self._bdd_cubes(v):
+                    cubes.append((assignment, n_state))
+
+            pos = np.zeros((len(cubes), len(self._atoms_list)), dtype=bool)
+            neg = np.zeros((len(cubes), len(self._atoms_list)), dtype=bool)
+            dst = np.zeros(len(cubes), dtype=np.int64)
+            for c, (assignment, n_state) in enumerate(cubes):
+                for p, val in assignment.items():
+                    if val:
+                        pos[c, index[p]] = True
+                    else:
+                        neg[c, index[p]] = True
+                dst[c] = n_state
+            self._cube_cache[state] = (pos, neg, dst)
+
+        return self._cube_cache[state]
+
+    def _bdd_cubes(self, u):
+        """
+        Returns the paths of BDD node `u` to `true` as a list of (disjoint) cubes. A cube is a dict
+        {atom: bool} over the atoms tested along the path; the atoms not in the cube are don't-cares.
+        """
+        if u == self._bdd.false:
+            return []
+        if u == self._bdd.true:
+            return [dict()]
+
+        cubes = []
+        for val in (True, False):
+            for cube in self._bdd_cubes(self._bdd.let({u.var: val}, u)):
+                cube[u.var] = val
+                cubes.append(cube)
+        return cubes
+
     def init_state(self):
         """ Initial state of automaton. """
         return int(self.spot_aut.get_init_state_number())
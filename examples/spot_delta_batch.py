@@ -0,0 +1,86 @@
+"""
+Checks SpotAutomaton.delta_batch against SpotAutomaton.delta.
+
+Also checks that the edge labels that SpotAutomaton translates structurally from spot (buddy) BDDs to `dd` BDDs
+equal the labels obtained from spot's formula strings, including formulas whose atoms spot and `dd` order differently.
+
+For every state and all 2^|atoms| inputs, the batched next state must equal the next state returned by delta
+(-1 where delta returns None, i.e. the automaton is incomplete). Inputs of wrong shape must raise ValueError.
+"""
+
+import itertools
+import numpy as np
+import spot
+from ggsolver.automata import SpotAutomaton
+
+
+def all_inputs(aut):
+    """ All 2^|atoms| inputs as rows of a boolean array, columns ordered as aut.atoms(). """
+    n_atoms = len(aut.atoms())
+    return np.array(list(itertools.product([False, True], repeat=n_atoms)), dtype=bool).reshape(-1, n_atoms)
+
+
+def atoms_true(aut, row):
+    """ Input row as the list of true atoms (input format of delta). """
+    return [p for p, val in zip(aut.atoms(), row) if val]
+
+
+def check_delta_batch(aut):
+    X = all_inputs(aut)
+    for q in aut.states():
+        batch = aut.delta_batch(q, X)
+        for k in range(X.shape[0]):
+            expected = aut.delta(q, atoms_true(aut, X[k]))
+            expected = -1 if expected is None else expected
+            assert batch[k] == expected, f"delta_batch({q}, {X[k]}) = {batch[k]}, but delta = {expected}."
+
+
+def check_edge_labels(aut):
+    """ Compiled edge labels must equal the labels parsed from spot formula strings (ff edges are dropped). """
+    bdd_dict = aut.spot_aut.get_dict()
+    for q in aut.states():
+        expected = []
+        for t in aut.spot_aut.out(q):
+            label = spot.formula(spot.bdd_format_formula(bdd_dict, t.cond))
+            if label.is_ff():
+                continue
+            v = aut._bdd.true if label.is_tt() else aut._bdd.add_expr(label.to_str('spin'))
+            expected.append((v, int(t.dst)))
+
+        compiled = aut._trans_cache[q]
+        assert len(compiled) == len(expected), f"State {q}: {len(compiled)} edges compiled, {len(expected)} expected."
+        for (v, dst), (v_exp, dst_exp) in zip(compiled, expected):
+            assert dst == dst_exp and v == v_exp, f"State {q}: label of edge to {dst} differs from spot formula."
+
+
+if __name__ == '__main__':
+    for formula, atoms in [
+        ("F a", None),
+        ("a U b", None),
+        ("G(a -> X b)", None),
+        ("G(b -> X a)", None),
+        ("G((z & a) -> X(m U b))", ["c"]),
+    ]:
+        aut = SpotAutomaton(formula=formula, atoms=atoms)
+        check_edge_labels(aut)
+        check_delta_batch(aut)
+        print(f"[OK] Edge labels and delta_batch agree with spot and delta for {formula}, "
+              f"spot atoms={[str(ap) for ap in aut.spot_aut.ap()]}, dd atoms={aut.atoms()}.")
+
+    # Without 'Complete' option, the monitor for G a has no transition on !a: delta is None, delta_batch is -1.
+    aut = SpotAutomaton(formula="G a", options=("Monitor", "Deterministic", "High", "SBAcc"))
+    check_edge_labels(aut)
+    check_delta_batch(aut)
+    assert -1 in aut.delta_batch(aut.init_state(), all_inputs(aut)).tolist()
+    print("[OK] delta_batch returns -1 for missing transitions of incomplete automaton for G a.")
+
+    # Inputs of wrong shape are rejected.
+    aut = SpotAutomaton(formula="a U b")
+    X = all_inputs(aut)
+    for bad in (X.T, X.reshape(-1), X[:, :, None], X[:, :1]):
+        try:
+            aut.delta_batch(aut.init_state(), bad)
+            raise AssertionError(f"delta_batch accepted input of shape {bad.shape}.")
+        except ValueError:
+            pass
+    print("[OK] delta_batch raises ValueError for inputs of wrong shape.")
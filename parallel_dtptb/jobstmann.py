@@ -15,7 +15,7 @@ logger.setLevel(logging.ERROR)
 class JobstmannGame(MyGame):
     def __init__(self, final):
         super(JobstmannGame, self).__init__()
-        self.param_final = final
+        self.param_final = frozenset(final)
 
     def states(self):
         #numpy array?
@@ -40,12 +40,12 @@ class JobstmannGame(MyGame):
 
     def final(self, state):
         #numba here
-        return True if state in self.param_final else False
+        return state in self.param_final
 
     def turn(self, state):
-        #numba here?
+        #SWinReacher.solver reads turn once per state into an ndarray (turn_arr) before the ZR loop
         #this is player 1 vs player 2 declaration
-        if state in [2]:
+        if state == 2:
         #if state in [0, 4, 6]:
             return 1
         else:
@@ -59,11 +59,11 @@ if __name__ == '__main__':
     states = game.states()
     actions = game.actions()
 
-    graph = game.matrixBuilder(game,states,actions)
+    graph, graph_T = game.matrixBuilder(game,states,actions)
     #-----------------------
     #win = SWinReach(graph)
     #SWinReach.solve()
-    final = SWinReacher.solver(game,game=game,G=graph,T=graph.T,final=game.param_final,i=1)
+    final = SWinReacher.solver(game,game=game,G=graph,T=graph_T,final=game.param_final,i=1)
     print('winning region: ',final)
     toc = time.perf_counter()
     print('\n', f"Completed in {toc - tic} seconds")
@@ -0,0 +1,37 @@
+"""
+Checks that MyGame.matrixBuilder builds the same graph for the Jobstmann game whether the transitions
+are given by the delta(s, a) callback (JobstmannGame) or by a trans_dict (MyGame(trans_dict=...)).
+"""
+
+from parallel_dtptb.solver import *
+from parallel_dtptb.models import *
+from parallel_dtptb.jobstmann import JobstmannGame
+import numpy as np
+
+
+if __name__ == '__main__':
+    game = JobstmannGame(final={3})
+    states = game.states()
+    actions = game.actions()
+
+    #same transitions as JobstmannGame.delta, plus an edge under an action that is not passed to matrixBuilder
+    trans_dict = {s: {a: game.delta(s, a) for a in actions if game.delta(s, a) is not None} for s in states}
+    trans_dict[3][(3, 0)] = 0
+    game_td = MyGame(
+        states=states,
+        actions=actions,
+        trans_dict=trans_dict,
+        turn={s: game.turn(s) for s in states},
+        final=game.param_final
+    )
+
+    G, T = game.matrixBuilder(game, states, actions)
+    G_td, T_td = game_td.matrixBuilder(game_td, states, actions)
+    for X, X_td in ((G, G_td), (T, T_td)):
+        assert np.array_equal(X.indptr, X_td.indptr) and np.array_equal(X.indices, X_td.indices)
+
+    win = SWinReacher.solver(game, game=game, G=G, T=T, final=game.param_final, i=1)
+    win_td = SWinReacher.solver(game_td, game=game_td, G=G_td, T=T_td, final=game.param_final, i=1)
+    assert set(win.tolist()) == set(win_td.tolist())
+    print('winning region: ', win)
+    print('delta and trans_dict graphs are identical')
@@ -2,8 +2,8 @@ import itertools
 
 from ggsolver.models import Game
 #from ggsolver.automata import DFA
-from numba import njit
 import numpy as np
+import scipy.sparse as sp
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -67,7 +67,10 @@ class DTPTBGame(Game):
 
 
 class MyGame(Game):
-
+    def __init__(self, **kwargs):
+        super(MyGame, self).__init__(**kwargs)
+        #keep the raw transition dictionary (if given) so matrixBuilder can skip the delta(s, a) callbacks
+        self._trans_dict = kwargs.get("trans_dict", None)
 
     def matrixBuilder(self, game,states, actions):
 
@@ -79,20 +82,40 @@ class MyGame(Game):
         states = dict(zip(states, range(len(states))))
         #actions = getattr(self, "actions")
         #actions = self.actions
-        m = len(actions)
-        actions = dict(zip(actions, range(len(actions))))
+        #actions are only iterated (edges are not indexed by action), so no action-index map is allocated
 
-        matrix_M = np.zeros((n, n, m))
-        matrix_A = np.zeros((n,n))
-        for s in states:
-            for a in actions:
-                ds = game.delta(s,a)
-                if(ds == None):
+        #collect edges as coordinate lists: memory is O(E) instead of a dense O(n^2 m) tensor
+        rows = []
+        cols = []
+        trans_dict = getattr(game, "_trans_dict", None)
+        if trans_dict is not None:
+            #game was given a trans_dict: read its edges in one O(E) pass (restricted to the given states
+            #and actions) instead of trying every (s, a) pair; gives the same edges as the delta(s, a) path
+            actions = set(actions)
+            for s, acts in trans_dict.items():
+                if s not in states:
                     continue
-                i = states[s]
-                j = states[ds]
-                k = actions[a]
-                matrix_M[i,j,k]=1
-                matrix_A[i,j]=1
+                for a, ds in acts.items():
+                    if ds is None or a not in actions:
+                        continue
+                    rows.append(states[s])
+                    cols.append(states[ds])
+        else:
+            for s in states:
+                for a in actions:
+                    ds = game.delta(s,a)
+                    if(ds == None):
+                        continue
+                    rows.append(states[s])
+                    cols.append(states[ds])
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+
+        #CSR representation of the graph (G) and its transpose (T):
+        #successors of v are G.indices[G.indptr[v]:G.indptr[v+1]], predecessors are the same slice of T
+        data = np.ones(len(rows), dtype=np.int8)
+        matrix_A = sp.csr_matrix((data, (rows, cols)), shape=(n, n))
+        matrix_A.sum_duplicates()
+        matrix_A.data[:] = 1
 
-        return matrix_A
+        return matrix_A, matrix_A.T.tocsr()
@@ -9,6 +9,56 @@ from numba import njit
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True)
+def _zr_attract(T_indptr, T_indices, turn_arr, removed, final_idx, live_out, tmpMap, player):
+    """
+    Backward attractor fixed-point of the ZR algo over raw arrays (compiled in nopython mode).
+    Returns the worklist `A` and the number of nodes `tail` in it, i.e. the win region is `A[:tail]`.
+    """
+    n = turn_arr.shape[0]
+
+    #preallocated worklist, nodes in A[head:tail] are yet to be expanded
+    #in_A guards the worklist so that every node is pushed at most once (hence A never exceeds n entries)
+    A = np.empty(n, dtype=np.int64)
+    in_A = np.zeros(n, dtype=np.bool_)
+    tail = 0
+    for v in final_idx:
+        if not in_A[v]:
+            A[tail] = v
+            tail += 1
+            in_A[v] = True
+
+    head = 0
+    while head < tail:
+        v = A[head]
+        for k in range(T_indptr[v], T_indptr[v + 1]):
+            v0 = T_indices[k]
+            if not removed[v0]:
+                attracted = False
+                if tmpMap[v0] == -1:
+                    if turn_arr[v0] == player:
+                        #get player 1
+                        attracted = True
+                        tmpMap[v0] = 0
+
+                    else:
+                        #get player 2 (live_out counts the non-removed successors, minus the edge just used)
+                        adj_counter = live_out[v0] - 1
+                        tmpMap[v0] = adj_counter
+                        if adj_counter == 0:
+                            attracted = True
+                if (turn_arr[v0] == 2) and (tmpMap[v0] > 0):
+                    tmpMap[v0] -= 1
+                    if tmpMap[v0] == 0:
+                        attracted = True
+                if attracted and not in_A[v0]:
+                    A[tail] = v0
+                    tail += 1
+                    in_A[v0] = True
+        head += 1
+    return A, tail
+
+
 class SWinReacher(Solver):
     """
     Computes sure winning region for player 1 or 2 to reach a set of final states in a deterministic
@@ -22,79 +72,50 @@ class SWinReacher(Solver):
     """
 
 
-    #can't use numba here as a result of the game objects/calls to game class that
-    #conflict with numba (NOT RAW DATA TYPE FOR COMPILATION)
+    #the game objects/calls to game class conflict with numba (NOT RAW DATA TYPE FOR COMPILATION),
+    #so turn/final are read into arrays here and the attractor loop runs in the _zr_attract kernel
     def solver(self, game,G, T,final,i):
-        """ This is where the ZR algo goes"""
-
-        #@njit
-        #...Interesting that this made the performance worse, must be used with append
-        #helper func to identify adjacent nodes
-        def adj(matrix, row):
-            temp = []
-            for col in range(np.shape(matrix)[1]):
-                if matrix[row, col] == 1:
-                    #temp.append(col)
-                    temp += [col]
-            return temp
+        """ This is where the ZR algo goes. Returns the winning region as an int64 ndarray of node indices."""
 
         #------------PARAMETERS------------
         #self,game = game objects (self wasn't allowing access to previous game)
-        #G = matrix_A from models (2D graph matrix)
-        # T = G.T
-        # Removed = removed set with nodes filtered out (initialized to empty set)
+        #G = matrix_A from models (2D graph matrix in CSR format)
+        # T = G.T (in CSR format, so that row v of T lists the predecessors of v)
+        # removed = boolean mask of nodes filtered out (initialized to all False)
         #final = list of final states------converted to A later on
         # i = attracting player (potentially turn??)
 
-        #in the future, create function that identifies removed nodes in game
-        #Removed = set()
-        Removed = []
-        for iter in range(np.shape(G)[0]):
-            if G[iter,iter] == 1 and game.turn(iter) == 2:
-                for iter1 in range(np.shape(G)[0]):
-                    if G[iter1,iter] == 1 and game.turn(iter)==2:
-                        Removed += [iter1]
+        n = G.shape[0]
 
-        #Removed = {1,2}
-        A = list(final)
+        #raw data for the numba kernel: turn of every node and indices of final states
+        turn_arr = np.fromiter((game.turn(s) for s in range(n)), dtype=np.int8, count=n)
+        final_idx = np.fromiter(final, dtype=np.intp)
+
+        #in the future, create function that identifies removed nodes in game
+        #a boolean mask gives O(1) membership tests (a list scan was O(|Removed|) per lookup)
+        #predecessors of player 2 nodes with a self-loop are removed: these are the rows of T at those nodes
+        removed = np.zeros(n, dtype=bool)
+        selfloop_p2 = np.flatnonzero((G.diagonal() != 0) & (turn_arr == 2))
+        if selfloop_p2.size:
+            removed[T[selfloop_p2].indices] = True
 
+        #number of non-removed successors of every node (live out-degree), computed once from the CSR arrays:
+        #out-degree minus the removed successors, counted per row by differencing a prefix sum over G.indices
+        removed_prefix = np.concatenate(([0], np.cumsum(removed[G.indices])))
+        live_out = np.diff(G.indptr) - (removed_prefix[G.indptr[1:]] - removed_prefix[G.indptr[:-1]])
 
         #initialize tmpMap with list representation of node connections
         #0 = final state
         #-1 = node connecting to path of final state
-        tmpMap = np.zeros((np.shape(G)[0],))
-        for x in range(np.shape(G)[0]):
-            if x in A:
-                tmpMap[x] = 0
-            else:
-                tmpMap[x] = -1
+        #int32 is enough for the counters (and a quarter of the bytes of the default float64)
+        tmpMap = np.full(n, -1, dtype=np.int32)
+        tmpMap[final_idx] = 0
 
         #bulk of ZR algo, here we expand our final states and iteratively solve our attractor (or win region)
-        index = 0
-        while index < len(A):
-            for v0 in adj(T, A[index]):
-                if v0 not in Removed:
-                    if tmpMap[v0] == -1:
-                       if game.turn(v0) == i:
-                           #get player 1
-                            A.append(v0)
-                            tmpMap[v0] = 0
-
-                       else:
-                           #get player 2
-                           adj_counter = -1
-                           for x in adj(G,v0):
-                               if x not in Removed:
-                                   adj_counter += 1
-                           tmpMap[v0] = adj_counter
-                           if adj_counter == 0:
-                               A.append(v0)
-                    if (game.turn(v0)== 2) and (tmpMap[v0] > 0):
-                        tmpMap[v0] -= 1
-                        if tmpMap[v0] == 0:
-                            A.append(v0)
-            index += 1
-        return A
+        #predecessors of node v are slices of the CSR index arrays of T, no need to scan full rows
+        A, tail = _zr_attract(T.indptr, T.indices, turn_arr, removed, final_idx, live_out, tmpMap, i)
+        #win region as a contiguous int64 array (no reboxing into Python ints)
+        return A[:tail]
 # class SWinSafe(SWinReach):
 #     """
 #     Computes sure winning region for player 1 or player 2 to remain within a set of final states in a deterministic